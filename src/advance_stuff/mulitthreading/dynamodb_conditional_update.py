@@ -1,7 +1,10 @@
 import boto3,os
 from boto3.dynamodb.conditions import Key
 import argparse
+import threading
 from datetime import datetime
+from boto3.dynamodb.table import BatchWriter
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr, AttributeNotExists
 
@@ -9,14 +12,33 @@ datasource = 'flight-19096'
 partition_key = '20200428'
 table_name = 'ygpp-devl-ingestion-notification'
 
-def get_boto3_resource(service='s3'):
+def get_boto3_resource(service='s3', config=None):
     session = boto3.session.Session()
-    return session.resource(service)
-
-def get_item():
-    dynamodb = get_boto3_resource('dynamodb')
-    table = dynamodb.Table(table_name)
-    resp = table.get_item(
+    return session.resource(service, config=config)
+
+# Adaptive retry mode backs off and rate limits on throttling errors in the client.
+ddb_config = Config(max_pool_connections=50,
+                    retries={'mode': 'adaptive', 'max_attempts': 10})
+_ddb_client = None
+_ddb_client_lock = threading.Lock()
+
+def get_ddb_client():
+    """
+    One dynamodb client shared by all the worker threads, so they reuse one HTTPS
+    connection pool. Clients are thread-safe, resources and Table objects are not.
+    It's the resource's client, so python values still work like with a Table.
+    Built on first use, importing this module doesn't need an AWS region.
+    """
+    global _ddb_client
+    with _ddb_client_lock:
+        if _ddb_client is None:
+            _ddb_client = get_boto3_resource('dynamodb', ddb_config).meta.client
+        return _ddb_client
+
+def get_item(client=None):
+    client = client or get_ddb_client()
+    resp = client.get_item(
+        TableName=table_name,
         Key={
             'datasource': datasource,
             'partitionkey': partition_key,
@@ -26,11 +48,10 @@ def get_item():
     print(resp)
 
 
-def update(col_name, col_val):
-    dynamodb = get_boto3_resource('dynamodb')
-    table = dynamodb.Table(table_name)
-
-    resp = table.update_item(
+def update(col_name, col_val, client=None):
+    client = client or get_ddb_client()
+    resp = client.update_item(
+        TableName=table_name,
         Key={
             'datasource': datasource,
             'partitionkey': partition_key,
@@ -57,11 +78,11 @@ over this at this time. Other solution is to schedule a a lambda S3 pull, instea
 if the processing happens at a particular time, like market closing, etc.
 
 '''
-def update_with_condition(col_name, col_val, ver_val):
-    dynamodb = get_boto3_resource('dynamodb')
-    table = dynamodb.Table(table_name)
+def update_with_condition(col_name, col_val, ver_val, client=None):
+    client = client or get_ddb_client()
     try:
-        resp = table.update_item(
+        resp = client.update_item(
+            TableName=table_name,
             Key={
                 'datasource': datasource,
                 'partitionkey': partition_key,
@@ -76,9 +97,69 @@ def update_with_condition(col_name, col_val, ver_val):
             ReturnValues="UPDATED_NEW"
         )
         print(resp)
+        print('retry attempts', resp['ResponseMetadata'].get('RetryAttempts', 0))
     except ClientError as e:
-        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-            print(e.response['Error'])
+        # a newer version is already stored, or throttling is still failing after
+        # all the retries; anything else is a real error the caller should see.
+        # Data-plane throttling of update_item shows up as ProvisionedThroughputExceeded
+        # or RequestLimitExceeded, ThrottlingException is the control-plane one
+        if e.response['Error']['Code'] in ('ConditionalCheckFailedException',
+                                           'ProvisionedThroughputExceededException',
+                                           'RequestLimitExceeded',
+                                           'ThrottlingException'):
+            print(e.response['Error'],
+                  'retry attempts', e.response['ResponseMetadata'].get('RetryAttempts', 0))
+        else:
+            raise
+
+
+'''
+Batching instead of one update_item round trip per row.
+A transaction takes up to 100 actions but can touch each item only once, and
+only the newest version of an item can pass the ver condition anyway, so only
+the highest version per key is sent. A failed condition cancels the whole
+transaction, so this fits loads where most incoming versions are newer.
+'''
+def bulk_update_conditional(items, client=None):
+    """items is an iterable of (key, col_name, col_val, ver_val)"""
+    client = client or get_ddb_client()
+    latest = {}
+    for key, col_name, col_val, ver_val in items:
+        item_key = tuple(sorted(key.items()))
+        if item_key not in latest or ver_val > latest[item_key][3]:
+            latest[item_key] = (key, col_name, col_val, ver_val)
+
+    updates = list(latest.values())
+    for start in range(0, len(updates), 100):
+        chunk = updates[start:start + 100]
+        try:
+            resp = client.transact_write_items(
+                TransactItems=[{
+                    'Update': {
+                        'TableName': table_name,
+                        'Key': key,
+                        'UpdateExpression': "set " + col_name + " = :value, ver = :ver",
+                        'ConditionExpression': ' attribute_not_exists(ver) or  :ver > ver ',
+                        'ExpressionAttributeValues': {
+                            ':value': col_val,
+                            ':ver': ver_val
+                        }
+                    }
+                } for key, col_name, col_val, ver_val in chunk]
+            )
+            print(resp)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                print(e.response.get('CancellationReasons', e.response['Error']))
+            else:
+                raise
+
+
+def bulk_put(items, client=None):
+    """unconditional writes, the batch writer sends them 25 at a time"""
+    with BatchWriter(table_name, client or get_ddb_client()) as bw:
+        for item in items:
+            bw.put_item(Item=item)
 
 
 '''
@@ -86,14 +167,12 @@ The following code is to test dynamodb conditional update
 works as desired when multiple updates happen on the same row/record
 '''
 
-import threading
-
 col_checksumver = 'checksumver'
 col_ver = 'valueofver'
 
-def worker(col_name, col_val, ver):
+def worker(col_name, col_val, ver, client=None):
     """thread worker function"""
-    update_with_condition(col_name, col_val, ver)
+    update_with_condition(col_name, col_val, ver, client)
     return
 
 '''
@@ -114,5 +193,25 @@ def run():
     get_item()
 
 
+def run_bulk():
+    key = {
+        'datasource': datasource,
+        'partitionkey': partition_key,
+    }
+    items = [(key, col_checksumver + str(i), col_ver + str(i) + " " + datetime.now().strftime('%Y%m%d%H%M%S%f'), i)
+             for i in range(40, 20, -2)]
+    bulk_update_conditional(items)
+
+    # see the update
+    print('get item')
+    get_item()
+
+
 if __name__ == '__main__':
-    run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bulk', action='store_true', help='send the updates as one transaction instead of threads')
+    args = parser.parse_args()
+    if args.bulk:
+        run_bulk()
+    else:
+        run()
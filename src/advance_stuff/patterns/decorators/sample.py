@@ -1,11 +1,22 @@
 '''
 ref: https://www.datacamp.com/community/tutorials/decorators-python
 '''
+import functools
+import logging
 
+logger = logging.getLogger(__name__)
 
+
+'''
+function here takes no arguments and always returns the same string, so its result is
+cached with lru_cache and computed only on the first call. Only do this for functions
+like that, a function with side effects or a changing result must be called every time.
+'''
 def uppercase_decorator(function):
+    cached_function = functools.lru_cache(maxsize=1)(function)
+
     def wrapper():
-        func = function()
+        func = cached_function()
         make_uppercase = func.upper()
         return make_uppercase
 
@@ -37,8 +48,11 @@ print('-------------------------------------------------------------------------
 Applying Multiple Decorators to a Single Function
 '''
 def split_string(function):
+    # same as uppercase_decorator, function takes no arguments and returns the same value
+    cached_function = functools.lru_cache(maxsize=1)(function)
+
     def wrapper():
-        func = function()
+        func = cached_function()
         splitted_string = func.split()
         return splitted_string
 
@@ -65,9 +79,11 @@ print('-------------------------------------------------------------------------
  Function defination  with parameters
 '''
 def decorator_with_arguments(function):
+    # functools.wraps copies __name__, __doc__ etc. of function onto the wrapper
+    @functools.wraps(function)
     def wrapper_accepting_arguments(arg1, arg2):
         print("Parameters passed to the function are: {0}, {1}".format(arg1,arg2))
-        function(arg1, arg2)
+        return function(arg1, arg2)
     return wrapper_accepting_arguments
 
 
@@ -81,10 +97,12 @@ print('-------------------------------------------------------------------------
 print('----------------------------------------------------------------------------')
 
 def a_decorator_passing_arguments(function_to_decorate):
+    @functools.wraps(function_to_decorate)
     def a_wrapper_accepting_arguments(*args,**kwargs):
         print('The positional arguments are', args)
         print('The keyword arguments are', kwargs)
-        function_to_decorate(*args, *kwargs)
+        # **kwargs passes keyword arguments as keywords, *kwargs would pass only the keys as positional arguments
+        return function_to_decorate(*args, **kwargs)
     return a_wrapper_accepting_arguments
 
 
@@ -100,4 +118,30 @@ print('-------------------------------------------------------------------------
 
 function_with_positional_keyword_arguments('first-parameter', 'second-parameter', 's3', 'us-east-2')
 
+print('----------------------------------------------------------------------------')
+print('----------------------------------------------------------------------------')
+
+'''
+Same decorator for functions called very often. print on every call is slow, so the
+arguments are logged only when DEBUG logging is enabled, and the check is done once
+when the function is decorated, not on every call.
+'''
+def a_logging_decorator_passing_arguments(function_to_decorate):
+    log_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    @functools.wraps(function_to_decorate)
+    def a_wrapper_accepting_arguments(*args, **kwargs):
+        if log_enabled:
+            logger.debug('args=%r kwargs=%r', args, kwargs)
+        return function_to_decorate(*args, **kwargs)
+    return a_wrapper_accepting_arguments
+
+
+logging.basicConfig(level=logging.DEBUG)
+
+@a_logging_decorator_passing_arguments
+def add(a, b, c=0):
+    return a + b + c
 
+print(add(1, 2, c=3))
+print(add.__name__)  # add, thanks to functools.wraps
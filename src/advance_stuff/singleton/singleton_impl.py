@@ -1,27 +1,45 @@
 import yaml
 
+# libyaml's C loader is much faster than PyYAML's pure python one,
+# it's only there when PyYAML was built against libyaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class SingletonMeta(type):
-    _instances = {}
+    # Each class keeps its own instance as a class attribute, one attribute read
+    # per call instead of two lookups in a dict shared by every singleton class
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        try:
+            instance = cls.__singleton_instance__
+            # a subclass inherits its parent's attribute, it needs its own instance
+            if type(instance) is cls:
+                return instance
+        except AttributeError:
+            pass
+        instance = super().__call__(*args, **kwargs)
+        cls.__singleton_instance__ = instance
+        return instance
 
 class Singleton(metaclass=SingletonMeta):
     _state = {}
     def __init__(self):
         self.factory_classes = {}
 
+    # _state and _state.get are bound as keyword-only default arguments when the class
+    # is built, so each call uses a local instead of looking up Singleton._state.
+    # Keyword-only so a positional argument can't replace them.
+
     @staticmethod
-    def update_state(key, value):
-        Singleton._state[key] = value
+    def update_state(key, value, *, _state=_state):
+        _state[key] = value
         print(f"State updated: {key} = {value}")
 
     @staticmethod
-    def get_state(self, key):
-        return Singleton._state.get(key, None)
+    def get_state(key, *, _get=_state.get):
+        return _get(key)
 
 
     def register_factory(self, action, factory_class):
@@ -29,11 +47,12 @@ class Singleton(metaclass=SingletonMeta):
 
     def parse_yaml(self, yaml_file):
         with open(yaml_file, 'r') as file:
-            actions = yaml.safe_load(file)
-            for action in actions:
-                factory_class = self.factory_classes.get(action['type'])
-                if factory_class:
-                    factory_instance = factory_class(action['params'])
-                    factory_instance.perform_action()
-                else:
-                    print(f"Unknown action type: {action['type']}")
+            actions = yaml.load(file, Loader=SafeLoader)
+        get_factory = self.factory_classes.get
+        for action in actions:
+            factory_class = get_factory(action['type'])
+            if factory_class:
+                factory_instance = factory_class(action['params'])
+                factory_instance.perform_action()
+            else:
+                print(f"Unknown action type: {action['type']}")
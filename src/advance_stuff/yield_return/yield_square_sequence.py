@@ -1,23 +1,50 @@
 # A Python program to generate squares from 1
 # to infinity using yield and therefore generator
+import math
 
 # An infinite generator function that prints
 # next square number. It starts with 1
 def nextSquare():
-    i = 1
+    i, square = 1, 1
 
     # An Infinite loop to generate squares
     while True:
-        yield i * i
+        yield square
+        # (i+1)^2 - i^2 = 2i + 1, so the next square is an add, no multiply
+        square += 2 * i + 1
         i += 1  # Next execution resumes
         # from this point
 
 def print_square_sequence_upto_given_limit(upper_limit):
+    lines = []
     for num in nextSquare():
         if num > upper_limit:
-            print(f'Limit reached {num}')
-            break;
-        print(f'keep going {num}')
+            lines.append(f'Limit reached {num}')
+            break
+        lines.append(f'keep going {num}')
+    # one print (one write to stdout) for the whole sequence instead of one per square
+    print('\n'.join(lines))
+
+
+# For bulk consumers that want all the squares at once, numpy squares the whole
+# range in one C loop. The generator above is still the way to stream them.
+def square_sequence_upto(upper_limit):
+    import numpy as np
+
+    arr = np.arange(1, math.isqrt(max(upper_limit, 0)) + 1, dtype=np.int64)
+    return arr * arr
+
+
+# Callers that only want how many squares there are, or their sum, don't need to
+# walk the sequence at all, both have a closed form.
+def count_squares_upto(upper_limit):
+    return math.isqrt(max(upper_limit, 0))
+
+
+def sum_squares_upto(upper_limit):
+    # 1^2 + 2^2 + ... + n^2 = n(n+1)(2n+1)/6
+    n = math.isqrt(max(upper_limit, 0))
+    return n * (n + 1) * (2 * n + 1) // 6
 
 
 if __name__ == '__main__':
@@ -1,5 +1,4 @@
 import ftplib
-import schedule
 import time
 from datetime import datetime, timedelta
 import smtplib
@@ -151,13 +150,17 @@ def monitor_ftp():
 
 
 def main():
-    schedule.every(TIME_INTERVAL).minutes.do(monitor_ftp)
-    # schedule.every(TIME_INTERVAL).minutes.do(simulate_file_transfer)
+    interval = TIME_INTERVAL * 60
 
     while True:
         try:
-            schedule.run_pending()
-            time.sleep(1)
+            # sleep until the next TIME_INTERVAL boundary on the clock (10:05, 10:10, ...),
+            # one wakeup per run instead of polling a scheduler every second
+            now = time.time()
+            next_tick = (now // interval + 1) * interval
+            time.sleep(next_tick - now)
+            monitor_ftp()
+            # simulate_file_transfer()
         except Exception as e:
             error_msg = f"ftpmon crashed: {str(e)}"
             logging.error(error_msg)
@@ -1,5 +1,4 @@
 import paramiko
-import schedule
 import time
 from datetime import datetime, timedelta
 import smtplib
@@ -7,6 +6,7 @@ from email.mime.text import MIMEText
 import uuid
 import logging
 import os
+import threading
 from shared_file_state import  update_file_status, add_file_status, get_file_status
 
 # Configure logging
@@ -19,10 +19,17 @@ SFTP_PORT = 22
 SFTP_USERNAME = ''
 SFTP_PASSWORD = ''
 REMOTE_PATH = f'/Users/{SFTP_USERNAME}/sftp_test'
+# remote paths always use '/', plain concatenation instead of os.path.join per file
+# (os.path.join would also use '\' when the monitor runs on windows)
+REMOTE_DIR_PREFIX = REMOTE_PATH.rstrip('/') + '/'
 BATCH_WINDOW = timedelta(minutes=7)
 TIME_INTERVAL = 5
 TEAM_LEADS_EMAILS = ['lead1@example.com', 'lead2@example.com']
 LOCAL_TEMP_DIR = 'temp_files'
+# paramiko's defaults (2 MB window, 32 KB packets) limit throughput on fast links,
+# a bigger window lets more data be in flight before waiting for the server
+SFTP_WINDOW_SIZE = 2 ** 22
+SFTP_MAX_PACKET_SIZE = 2 ** 18  # 256 KB, the largest OpenSSH channels use
 os.makedirs(LOCAL_TEMP_DIR, exist_ok=True)
 
 
@@ -32,6 +39,12 @@ parent_job_map = {}
 current_batch_start_time = None
 current_parent_job_id = None
 
+# One SSH/SFTP connection kept open across the scheduled runs, instead of a new
+# SSH handshake for every connectivity test and file listing
+_sftp_lock = threading.Lock()
+_ssh = None
+_sftp = None
+
 def send_email(subject, body):
     print(rf'Subject: {subject}, Body: {body}')
     return
@@ -51,14 +64,48 @@ def send_email(subject, body):
     # except Exception as e:
     #     logging.error(f"Failed to send email: {str(e)}")
 
+def _close_sftp():
+    global _ssh, _sftp
+    if _ssh is not None:
+        _ssh.close()
+    _ssh = _sftp = None
+
+
+def get_sftp():
+    """Returns the shared SFTP client, connecting again if the connection dropped."""
+    global _ssh, _sftp
+    with _sftp_lock:
+        if _sftp is not None and _sftp.get_channel().get_transport().is_active():
+            return _sftp
+        _close_sftp()
+        ssh = paramiko.SSHClient()
+        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            ssh.connect(SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD)
+            _sftp = paramiko.SFTPClient.from_transport(ssh.get_transport(),
+                                                       window_size=SFTP_WINDOW_SIZE,
+                                                       max_packet_size=SFTP_MAX_PACKET_SIZE)
+        except Exception:
+            ssh.close()
+            raise
+        _ssh = ssh
+        return _sftp
+
+
+def reset_sftp():
+    """Drops the shared connection, the next get_sftp() reconnects."""
+    with _sftp_lock:
+        _close_sftp()
+
+
 def test_sftp_connectivity():
     try:
-        with paramiko.SSHClient() as ssh:
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD)
+        # cheap round trip on the open connection, connects if there isn't one
+        get_sftp().stat(REMOTE_PATH)
         logging.info("SFTP connection test successful")
         return True
     except Exception as e:
+        reset_sftp()
         error_msg = f"SFTP connection test failed: {str(e)}"
         logging.error(error_msg)
         send_email("SFTP Connectivity Error", error_msg)
@@ -70,22 +117,22 @@ We'll need to retrieve all files and filter them on the client side.
 '''
 def get_sftp_file_list(time_window_minutes=5):
     try:
-        with paramiko.SSHClient() as ssh:
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD)
-            sftp = ssh.open_sftp()
+        sftp = get_sftp()
 
-            now = datetime.now()
-            time_threshold = now - timedelta(minutes=time_window_minutes)
+        now = datetime.now()
+        time_threshold = now - timedelta(minutes=time_window_minutes)
+        # compare the raw st_mtime numbers, a datetime is only built for files we keep
+        threshold_ts = time_threshold.timestamp()
 
-            filtered_files = []
-            for file_attr in sftp.listdir_attr(REMOTE_PATH):
-                file_mtime = datetime.fromtimestamp(file_attr.st_mtime)
-                if file_mtime > time_threshold:
-                    filtered_files.append((file_attr.filename, file_mtime))
+        filtered_files = []
+        # listdir_attr gets names and stats in one round trip, no sftp.stat per file
+        for file_attr in sftp.listdir_attr(REMOTE_PATH):
+            if file_attr.st_mtime > threshold_ts:
+                filtered_files.append((file_attr.filename, datetime.fromtimestamp(file_attr.st_mtime)))
 
-            return sorted(filtered_files, key=lambda x: x[1])
+        return sorted(filtered_files, key=lambda x: x[1])
     except Exception as e:
+        reset_sftp()
         logging.error(f"Failed to get SFTP file list: {str(e)}")
         return []
 
@@ -141,31 +188,27 @@ def simulate_file_transfer():
     transferred_files = []
 
     try:
-        with paramiko.SSHClient() as ssh:
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(SFTP_HOST, SFTP_PORT, SFTP_USERNAME, SFTP_PASSWORD)
-            sftp = ssh.open_sftp()
-
-            for i in range(num_files):
-                filename = f"file_{uuid.uuid4()}.txt"
-                local_path = os.path.join(LOCAL_TEMP_DIR, filename)
-                remote_path = os.path.join(REMOTE_PATH, filename)
+        sftp = get_sftp()
 
-                # Create a random file
-                create_random_file(filename)
+        for i in range(num_files):
+            filename = f"file_{uuid.uuid4()}.txt"
+            local_path = os.path.join(LOCAL_TEMP_DIR, filename)
+            remote_path = REMOTE_DIR_PREFIX + filename
 
-                # Transfer the file
-                sftp.put(local_path, remote_path)
+            # Create a random file
+            create_random_file(filename)
 
-                # Update file status
-                update_file_status(filename, 'open')
+            # Transfer the file
+            sftp.put(local_path, remote_path)
 
-                transferred_files.append(filename)
-                logging.info(f"Transferred file: {filename}")
+            # Update file status
+            update_file_status(filename, 'open')
 
-            sftp.close()
+            transferred_files.append(filename)
+            logging.info(f"Transferred file: {filename}")
 
     except Exception as e:
+        reset_sftp()
         logging.error(f"Error in simulating file transfer: {str(e)}")
         for filename in transferred_files:
             update_file_status(filename, 'error')
@@ -191,13 +234,17 @@ def monitor_sftp():
     cleanup()
 
 def main():
-    schedule.every(TIME_INTERVAL).minutes.do(monitor_sftp)
-    # schedule.every(TIME_INTERVAL).minutes.do(simulate_file_transfer)
+    interval = TIME_INTERVAL * 60
 
     while True:
         try:
-            schedule.run_pending()
-            time.sleep(1)
+            # sleep until the next TIME_INTERVAL boundary on the clock (10:05, 10:10, ...),
+            # one wakeup per run instead of polling a scheduler every second
+            now = time.time()
+            next_tick = (now // interval + 1) * interval
+            time.sleep(next_tick - now)
+            monitor_sftp()
+            # simulate_file_transfer()
         except Exception as e:
             error_msg = f"ftpmon crashed: {str(e)}"
             logging.error(error_msg)
@@ -1,9 +1,11 @@
 import numpy as np
-import pandas as pd
-from wordcloud import WordCloud, STOPWORDS, ImageColorGenerator
+from wordcloud import WordCloud, STOPWORDS
 import matplotlib.pyplot as plt
 from PIL import Image
-import random
+import itertools
+import hashlib
+import os
+import pickle
 
 hsl_arr = [ "hsl(342, 75%, 62%)",
             "hsl(24, 64%,  45%)",
@@ -12,28 +14,36 @@ hsl_arr = [ "hsl(342, 75%, 62%)",
             "hsl(39, 100%, 50%)",
             "hsl(248, 53%, 58%)"]
 
+# grey_color_func is called once per placed word, pick all the colors up front
+# with one numpy call instead of a random.randint per word.
+color_pool = [hsl_arr[i] for i in np.random.default_rng(3).integers(0, len(hsl_arr), size=4096)]
+color_idx = itertools.count()
+
 def grey_color_func(word, font_size, position, orientation, random_state=None,
                     **kwargs):
     # return "hsl(0, 0%%, %d%%)" % random.randint(40, 60)
-    return hsl_arr[random.randint(0, 5)]
+    return color_pool[next(color_idx) & 4095]
 
 
-mic_mask = np.array(Image.open("img/mic.png"))
+# asarray gives a read-only view of the decoded pixels instead of a second copy,
+# WordCloud only reads the mask.
+mic_img = Image.open("img/mic.png")
+mic_img.load()
+mic_mask = np.asarray(mic_img)
 plt.imshow(mic_mask)
 plt.axis("off")
 plt.show()
 
-wc_mic = WordCloud(width=1080,
-                   height=1080,
-                   stopwords=STOPWORDS,
-                   background_color="white",
-                   max_words=1008,
-                   contour_width=6,
-                   repeat=True,
-                   mask=mic_mask,
-                   min_font_size=1,
-                   contour_color='darkgreen'
-                   )
+wc_params = dict(width=1080,
+                 height=1080,
+                 stopwords=STOPWORDS,
+                 background_color="white",
+                 max_words=1008,
+                 contour_width=6,
+                 repeat=True,
+                 min_font_size=1,
+                 contour_color='darkgreen'
+                 )
 
 # wc_mic = WordCloud(background_color="white",
 #                       mask=mic_mask,
@@ -49,7 +59,25 @@ text = {'Sangam': 25, '50th': 25, 'Birthday': 25, 'Happy': 25, 'singer':16,
         'toastmaster':9, 'reliable':7, 'music':9, 'warm-hearted':9, 'practical':9,
         'sincere':9, 'trustworthy':9, 'affable':9, 'truthful':9, 'resourceful':9,
         'integrity':9, 'kind':9 }
-wc_mic.fit_words(text)
+
+# Laying out the words is the slow part. When only the colors change between
+# runs, the mask, params and text are the same, so reuse the fitted WordCloud.
+# STOPWORDS is a set, sort it so the key is the same on every run.
+params_key = sorted((k, sorted(v) if isinstance(v, set) else v) for k, v in wc_params.items())
+cache_key = hashlib.blake2b(mic_mask.tobytes()
+                            + repr(params_key).encode()
+                            + repr(sorted(text.items())).encode(),
+                            digest_size=16).hexdigest()
+cache_path = f"img/.wc_mic_{cache_key}.pkl"
+
+if os.path.exists(cache_path):
+    with open(cache_path, 'rb') as f:
+        wc_mic = pickle.load(f)
+else:
+    wc_mic = WordCloud(mask=mic_mask, **wc_params)
+    wc_mic.fit_words(text)
+    with open(cache_path, 'wb') as f:
+        pickle.dump(wc_mic, f)
 
 
 default_colors = wc_mic.to_array()
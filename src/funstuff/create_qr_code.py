@@ -5,6 +5,10 @@ pip install qrcode
 import qrcode
 from PIL import Image, ImageDraw, ImageFont
 
+# Load the font once, not on every generate_qr_code call
+font_path = "/Library/Fonts/Arial.ttf"  # Adjust the path if necessary
+font = ImageFont.truetype(font_path, 15)
+
 def generate_qr_code(text, url, filename):
     # Combine text and URL
     data = f"{text}\n{url}"
@@ -23,15 +27,12 @@ def generate_qr_code(text, url, filename):
     #img = qr.make_image(fill_color="#FBBB04", back_color="white")
     img = qr.make_image(fill_color="#00008b", back_color="white") # dark blue
 
-    # Load a font
-    font_path = "/Library/Fonts/Arial.ttf"  # Adjust the path if necessary
-    font = ImageFont.truetype(font_path, 15)
-
     # Create a drawing context
     draw = ImageDraw.Draw(img)
 
-    # Calculate text width and height
-    text_width, text_height = draw.textsize(text, font=font)
+    # Calculate text width and height, textsize was removed in Pillow 10
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    text_width, text_height = right - left, bottom - top
 
     # Calculate x, y position for the text
     x = (img.size[0] - text_width) / 2
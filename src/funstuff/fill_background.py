@@ -20,7 +20,9 @@ im.convert("RGB").save(r"img/cricket_wht_bg.png")
 import numpy as np
 import matplotlib.pyplot as plt
 from PIL import Image
-mic_mask = np.array(Image.open("img/cricket_wht_bg.png"))
+mic_img = Image.open("img/cricket_wht_bg.png")
+mic_img.load()
+mic_mask = np.asarray(mic_img)
 plt.imshow(mic_mask)
 plt.axis("off")
 plt.show()
\ No newline at end of file
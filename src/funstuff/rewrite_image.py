@@ -12,7 +12,10 @@ import numpy as np
 im = cv2.imread("img/mic.png")
 
 # Make all pixels that are not black perfectly  pixels white
-im[np.all(im != (0, 0, 0), axis=-1)] = (255,255,255)
+# np.all on the uint8 channels treats 0 as False, so it gives the same mask as
+# np.all(im != (0, 0, 0), axis=-1) without building the temporary != array
+non_black = np.all(im, axis=-1)
+im[non_black] = 255
 
 # Save result
 cv2.imwrite('img/mic_pixels_updated.png', im)
\ No newline at end of file
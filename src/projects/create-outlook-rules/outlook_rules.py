@@ -1,7 +1,7 @@
 # This script manages Outlook email rules using Exchange Web Services (EWS)
 # It allows users to create rules based on email subject filters and move matching emails to specified folders
 
-from exchangelib import Credentials, Account, DELEGATE, Configuration
+from exchangelib import Credentials, Account, DELEGATE, Configuration, Folder
 from exchangelib.folders import Root
 import logging
 import sys
@@ -38,6 +38,14 @@ class OutlookRulesManager:
         self.password = password
         self.server = server
         self.account = None
+        # Lowercased folder name -> Folder for every folder seen so far, so the
+        # mailbox tree is walked over EWS at most once
+        self._folder_index = {}
+        # Paused walk of the mailbox folders, resumed when a name isn't indexed yet
+        self._folder_walk = None
+        self._folder_walk_done = False
+        # Lowercased names of the inbox rules, fetched on first check
+        self._rule_names = None
 
     def connect(self):
         """
@@ -66,27 +74,62 @@ class OutlookRulesManager:
             logger.error(f"Connection error: {str(e)}")
             return False
 
+    def _walk(self, folder):
+        """
+        Yield folder and all of its subfolders, depth first.
+
+        Args:
+            folder: Folder to start from
+        """
+        yield folder
+        for child in folder.children:
+            yield from self._walk(child)
+
     def get_folder(self, folder_name):
         """
         Find a folder by name in the user's mailbox.
 
+        Only the message folders (msg_folder_root) are searched, and the walk
+        stops at the first match. Folders seen on the way are indexed, so later
+        lookups continue the walk instead of starting over.
+
         Args:
             folder_name (str): Name of the folder to find
 
         Returns:
             Folder object if found, None otherwise
         """
+        # Case-insensitive folder name comparison
+        name = folder_name.lower()
+        if name in self._folder_index:
+            return self._folder_index[name]
+        if self._folder_walk_done:
+            return None
+
         try:
-            # Walk through all folders in the mailbox
-            for folder in self.account.root.walk():
-                # Case-insensitive folder name comparison
-                if folder.name.lower() == folder_name.lower():
+            if self._folder_walk is None:
+                self._folder_walk = self._walk(self.account.msg_folder_root)
+            for folder in self._folder_walk:
+                # The first folder found wins when names repeat
+                self._folder_index.setdefault(folder.name.lower(), folder)
+                if folder.name.lower() == name:
                     return folder
+            self._folder_walk_done = True
             return None
         except Exception as e:
+            # A failed walk can't be resumed, start a new one next time
+            self._folder_walk = None
             logger.error(f"Error finding folder: {str(e)}")
             return None
 
+    def refresh_rules(self):
+        """
+        Fetch the inbox rule names from the server again.
+
+        Call this if rules were changed outside this manager.
+        """
+        self._rule_names = {rule.name.lower() for rule in self.account.inbox.inbox_rules.get()}
+
     def check_rule_exists(self, rule_name):
         """
         Check if a rule with the given name already exists.
@@ -98,14 +141,12 @@ class OutlookRulesManager:
             bool: True if rule exists, False otherwise
         """
         try:
-            # Get all existing inbox rules
-            rules = self.account.inbox.inbox_rules.get()
+            # Get all existing inbox rules on the first call only
+            if self._rule_names is None:
+                self.refresh_rules()
 
             # Case-insensitive rule name comparison
-            for rule in rules:
-                if rule.name.lower() == rule_name.lower():
-                    return True
-            return False
+            return rule_name.lower() in self._rule_names
         except Exception as e:
             logger.error(f"Error checking rule existence: {str(e)}")
             return False
@@ -127,8 +168,11 @@ class OutlookRulesManager:
                 logger.warning(f"Folder '{folder_name}' already exists")
                 return existing_folder
 
-            # Create new folder in root of mailbox
-            new_folder = self.account.root.create_folder(folder_name)
+            # Create new folder under the message folder root, where the
+            # user can see it and where get_folder searches
+            new_folder = Folder(parent=self.account.msg_folder_root, name=folder_name)
+            new_folder.save()
+            self._folder_index[folder_name.lower()] = new_folder
             logger.info(f"Created folder: {folder_name}")
             return new_folder
         except Exception as e:
@@ -174,6 +218,8 @@ class OutlookRulesManager:
 
             # Create the rule in the inbox
             self.account.inbox.inbox_rules.create(**rule)
+            if self._rule_names is not None:
+                self._rule_names.add(rule_name.lower())
             logger.info(f"Successfully created rule: {rule_name}")
             return True
 
@@ -1,5 +1,5 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
-import pandas as pd
+from flask import Flask, render_template, request, redirect, url_for, flash, make_response, session
+import uuid
 
 app = Flask(__name__)
 app.secret_key = 'your_secret_key_here'  # Required for flashing messages
@@ -7,53 +7,64 @@ app.secret_key = 'your_secret_key_here'  # Required for flashing messages
 # Assuming file_monitor is your FileMonitor instance
 file_monitor = None
 
+# Prefix for the ETag so versions from an earlier run of the app never match
+etag_prefix = uuid.uuid4().hex[:8]
+
 
 @app.route('/')
 def index():
     page = request.args.get('page', 1, type=int)
     per_page = 10
 
-    # Get current state
-    df = file_monitor.state_tracker.get_dataframe()
+    # The version changes whenever the tracked data changes, if the browser
+    # already has this version of the page skip the query and templating.
+    # Pending flash messages still need a fresh render.
+    total_records, version = file_monitor.state_tracker.stats()
+    etag = f'{etag_prefix}-{version}'
+    if request.if_none_match.contains(etag) and '_flashes' not in session:
+        return '', 304
 
-    # Sort by latest in_time
-    df = df.sort_values('in_time', ascending=False)
+    # Get the current page, sorted by latest in_time
+    start_idx = (page - 1) * per_page
+    # records are FileRecord namedtuples, the template reads fields as record.name
+    records, _ = file_monitor.state_tracker.get_page(start_idx, per_page)
 
     # Calculate pagination
-    total_records = len(df)
     total_pages = (total_records + per_page - 1) // per_page
 
-    # Get subset for current page
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    current_data = df.iloc[start_idx:end_idx]
-
-    # Convert to list of dicts for template
-    records = current_data.to_dict('records')
-
-    return render_template(
+    response = make_response(render_template(
         'file_monitor.html',
         records=records,
         page=page,
         total_pages=total_pages,
         total_records=total_records
-    )
+    ))
+    response.set_etag(etag)
+    return response
 
 
 @app.route('/clear', methods=['POST'])
 def clear_data():
     try:
-        # Clear the DataFrame in thread-safe manner
-        file_monitor.state_tracker.clear_data()
+        # Hand the clear to the monitor's command thread, so this request
+        # doesn't wait on the state tracker lock
+        file_monitor.post(('clear',))
         # Store flash message in session
-        flash('Data cleared successfully!', 'success')
+        flash('Data clear requested!', 'success')
     except Exception as e:
         # Store error message in session
         flash(f'Error clearing data: {str(e)}', 'error')
     return redirect(url_for('index'))
 
 
-def start_web_interface(monitor_instance, host='0.0.0.0', port=5000):
+def start_web_interface(monitor_instance, host='0.0.0.0', port=5000, threads=8):
     global file_monitor
     file_monitor = monitor_instance
-    app.run(host=host, port=port)
\ No newline at end of file
+    # waitress serves requests on a pool of threads, so page views and /clear
+    # don't wait on each other. Flask's dev server is the fallback.
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host=host, port=port, threaded=True)
+    else:
+        serve(app, host=host, port=port, threads=threads)
@@ -13,6 +13,7 @@ Architecture:
 1. WorkerManager: Gathers files periodically and adds them to a processing queue
 2. Worker Pool: Multiple workers monitor file status and handle processing
 3. ShutdownMonitor: Enables graceful system shutdown
+4. CommandProcessor: Applies commands posted by the web UI (e.g. clear)
 
 Key Components:
 -------------
@@ -25,7 +26,7 @@ APIs Used:
 - fileArrivalAPI: Retrieves list of available files
 - fileStatusAPI: Checks processing status of files
 - alertAPI: Raises alerts via email or logs
-- createManifest: Creates manifest files for gathered files
+- createManifest: Creates manifest files for gathered files (in a process pool)
 
 Usage:
 -----
@@ -43,22 +44,33 @@ graceful shutdown. The file will be renamed to 'shutdown.now.started' during
 the shutdown process.
 """
 
+import multiprocessing
 import uuid
 import time
 import queue
 import threading
-import schedule
 from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import os
-from typing import List, Dict, Optional, NamedTuple
-import pandas as pd
+from typing import List, Dict, Optional, NamedTuple, Set, Tuple
+import bisect
+import heapq
+import itertools
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+
+# inotify_simple is optional (Linux only), ShutdownMonitor polls without it
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 
 class FileStatus(Enum):
@@ -76,7 +88,11 @@ class FileMetadata(NamedTuple):
     modified_time: datetime
 
 
-@dataclass
+# dataclass(slots=True) needs python 3.10, older interpreters get a plain dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class FileObject:
     """
     Represents a file in the processing system with its metadata and status.
@@ -88,6 +104,8 @@ class FileObject:
         status: Current processing status of the file
         attempts: Number of monitoring attempts made
         alert: Alert sent True/False
+        start_time: When a worker started monitoring the file
+        end_time: When a worker finished monitoring the file
     """
     file_name: str
     file_size: int
@@ -95,6 +113,9 @@ class FileObject:
     status: FileStatus = FileStatus.PENDING
     attempts: int = 0
     alert:bool = False
+    # Set by the Worker, declared here since a slots dataclass has no __dict__
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
 
     def matches(self, other_metadata: FileMetadata) -> bool:
         """
@@ -110,54 +131,171 @@ class FileObject:
                 self.file_size == other_metadata.size and
                 self.in_time == other_metadata.modified_time)
 
+class FileRecord(NamedTuple):
+    """One row of the state tracker, the web UI reads the fields by name."""
+    file_name: str
+    file_size: int
+    in_time: datetime
+    status: str
+    attempts: int
+    alert: bool
+
+
+class _TrackerShard:
+    """One slice of the FileStateTracker rows, with its own lock."""
+
+    def __init__(self):
+        self.rows: Dict[Tuple[str, int], FileRecord] = {}
+        self.sorted_by_in_time: List[Tuple[datetime, Tuple[str, int]]] = []
+        # Keys of files recorded as COMPLETE or FAIL -> in_time of that delivery
+        self.final: Dict[Tuple[str, int], datetime] = {}
+        # Bumped on every change to this shard
+        self.version = 0
+        self.lock = threading.Lock()
+
+
 class FileStateTracker:
     """
-    Tracks file states in a thread-safe manner using a DataFrame.
+    Tracks file states in a thread-safe manner.
+
+    Rows are kept in a dict keyed by (file_name, file_size), plus a list of
+    (in_time, key) kept sorted with bisect, so the web UI can read a page of
+    the newest files without sorting everything on each request.
+
+    The rows are split over NUM_SHARDS shards by file name, each with its own
+    lock, so workers updating different files rarely wait on each other.
+    Readers that need every row take all the shard locks, always in order.
     """
 
+    NUM_SHARDS = 8  # must be a power of 2
+    SHARD_MASK = NUM_SHARDS - 1
+    # A file in one of these states never changes again
+    TERMINAL_STATUSES = frozenset({FileStatus.COMPLETE, FileStatus.FAIL})
+
     def __init__(self):
-        self.df = pd.DataFrame(columns=[
-            'file_name', 'file_size', 'in_time', 'status',
-            'attempts', 'alert'
-        ])
-        self.lock = threading.Lock()
+        self._shards = [_TrackerShard() for _ in range(self.NUM_SHARDS)]
+
+    def _shard_for(self, file_name: str) -> _TrackerShard:
+        return self._shards[hash(file_name) & self.SHARD_MASK]
+
+    @contextmanager
+    def _all_shards_locked(self):
+        """Hold every shard lock, acquired in a fixed order to avoid deadlocks."""
+        for shard in self._shards:
+            shard.lock.acquire()
+        try:
+            yield self._shards
+        finally:
+            for shard in reversed(self._shards):
+                shard.lock.release()
+
+    @staticmethod
+    def _make_record(file_obj: FileObject) -> FileRecord:
+        return FileRecord(
+            file_name=file_obj.file_name,
+            file_size=file_obj.file_size,
+            in_time=file_obj.in_time,
+            status=file_obj.status.value,
+            attempts=file_obj.attempts,
+            alert=file_obj.alert
+        )
+
+    def _store(self, shard: _TrackerShard, file_obj: FileObject) -> None:
+        """Write one file's row into shard, the caller holds shard.lock."""
+        key = (file_obj.file_name, file_obj.file_size)
+        if shard.final.get(key) == file_obj.in_time:
+            return
+        record = self._make_record(file_obj)
+        old = shard.rows.get(key)
+        if old is None:
+            bisect.insort(shard.sorted_by_in_time, (record.in_time, key))
+        elif old.in_time != record.in_time:
+            # in_time moved, re-position the file in the sorted index
+            shard.sorted_by_in_time.remove((old.in_time, key))
+            bisect.insort(shard.sorted_by_in_time, (record.in_time, key))
+        shard.rows[key] = record
+        shard.version += 1
+        if file_obj.status in self.TERMINAL_STATUSES:
+            shard.final[key] = record.in_time
+        else:
+            # a new delivery of a finished file, track it again
+            shard.final.pop(key, None)
 
     def update_file_state(self, file_obj: FileObject):
         """
-        Updates or adds a file's state in the DataFrame.
+        Updates or adds a file's state.
         Uses composite key of file_name + file_size for uniqueness.
+
+        Once a file is recorded as COMPLETE or FAIL, later updates for the
+        same delivery (same in_time) are skipped. A new delivery with the same
+        name and size replaces it.
         """
-        with self.lock:
-            row = {
-                'file_name': file_obj.file_name,
-                'file_size': file_obj.file_size,
-                'in_time': file_obj.in_time,
-                'status': file_obj.status.value,
-                'attempts': file_obj.attempts,
-                'alert': file_obj.alert
-            }
-
-            # Create composite mask using both file_name and file_size
-            mask = (self.df['file_name'] == file_obj.file_name) & \
-                   (self.df['file_size'] == file_obj.file_size)
-
-            if mask.any():
-                self.df.loc[mask] = pd.Series(row)
+        shard = self._shard_for(file_obj.file_name)
+        # Cheap check without the lock, _store checks again under it
+        if shard.final.get((file_obj.file_name, file_obj.file_size)) == file_obj.in_time:
+            return
+
+        with shard.lock:
+            self._store(shard, file_obj)
+
+    def bulk_update(self, file_objs: List[FileObject]):
+        """
+        Updates or adds the state of many files, e.g. a whole gather.
+
+        Each shard lock is taken once for all of its files, instead of once
+        per file.
+        """
+        by_shard: Dict[int, List[FileObject]] = {}
+        for file_obj in file_objs:
+            by_shard.setdefault(hash(file_obj.file_name) & self.SHARD_MASK, []).append(file_obj)
+
+        for index, shard_files in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                for file_obj in shard_files:
+                    self._store(shard, file_obj)
+
+    def get_dataframe(self):
+        """Returns the current state as a new pandas DataFrame"""
+        # pandas is only needed here, keep it off the import path of the monitor
+        import pandas as pd
+
+        with self._all_shards_locked() as shards:
+            records = [record for shard in shards for record in shard.rows.values()]
+        return pd.DataFrame(records, columns=list(FileRecord._fields))
+
+    def get_page(self, offset: int, limit: int, descending: bool = True):
+        """
+        Returns one page of rows ordered by in_time and the total number of rows.
+
+        Each shard's index is already sorted, so this merges them and stops
+        after offset + limit entries.
+        """
+        with self._all_shards_locked() as shards:
+            total = sum(len(shard.rows) for shard in shards)
+            if descending:
+                merged = heapq.merge(*(reversed(shard.sorted_by_in_time) for shard in shards),
+                                     reverse=True)
             else:
-                self.df.loc[len(self.df)] = row
+                merged = heapq.merge(*(shard.sorted_by_in_time for shard in shards))
+            page = [self._shard_for(key[0]).rows[key]
+                    for _, key in itertools.islice(merged, offset, offset + limit)]
+            return page, total
 
-    def get_dataframe(self) -> pd.DataFrame:
-        """Returns a copy of the current DataFrame"""
-        with self.lock:
-            return self.df.copy()
+    def stats(self):
+        """Returns (row count, version)"""
+        with self._all_shards_locked() as shards:
+            return (sum(len(shard.rows) for shard in shards),
+                    sum(shard.version for shard in shards))
 
     def clear_data(self):
-        """Clears all data from the DataFrame"""
-        with self.lock:
-            self.df = pd.DataFrame(columns=[
-                'file_name', 'file_size', 'in_time', 'status',
-                'attempts', 'alert'
-            ])
+        """Clears all tracked file states"""
+        with self._all_shards_locked() as shards:
+            for shard in shards:
+                shard.rows.clear()
+                shard.sorted_by_in_time.clear()
+                shard.final.clear()
+                shard.version += 1
 
 class GatherObject:
     """
@@ -169,6 +307,8 @@ class GatherObject:
     def __init__(self):
         self.parent_job_id = str(uuid.uuid4())
         self.files: List[FileObject] = []
+        # (name, size, modified_time) of every file in self.files
+        self._keys: Set[Tuple[str, int, datetime]] = set()
         self.gather_start_time = datetime.now()
 
     def has_duplicate(self, file_metadata: FileMetadata) -> bool:
@@ -181,8 +321,8 @@ class GatherObject:
         Returns:
             True if a matching file exists, False otherwise
         """
-        return any(existing_file.matches(file_metadata)
-                   for existing_file in self.files)
+        return (file_metadata.name, file_metadata.size,
+                file_metadata.modified_time) in self._keys
 
     def add_file(self, file_metadata: FileMetadata) -> None:
         """
@@ -198,8 +338,29 @@ class GatherObject:
                 in_time=file_metadata.modified_time
             )
             self.files.append(file_obj)
-            # Update state tracker
-            self.file_monitor.state_tracker.update_file_state(file_obj)
+            self._keys.add((file_metadata.name, file_metadata.size,
+                            file_metadata.modified_time))
+
+def build_manifest(parent_job_id: str, file_name: str) -> str:
+    """
+    Creates the manifest file for one gathered file.
+
+    Runs in a FileMonitor manifest pool process, it is a module level function
+    so it can be pickled. CPU heavy work here (hashing, compression) doesn't
+    hold the GIL of the monitor threads.
+
+    Args:
+        parent_job_id: parent_job_id of the GatherObject
+        file_name: Name of the gathered file
+
+    Returns:
+        Name of the manifest file
+    """
+    manifest_name = f"{parent_job_id}_{file_name}.manifest"
+    # Implementation would go here
+    print(f"Created manifest: {manifest_name}")
+    return manifest_name
+
 
 class FileMonitor:
     """
@@ -227,7 +388,9 @@ class FileMonitor:
                  monitor_interval: int = 2,
                  monitor_check_times: int = 15,
                  num_workers: int = 3):
-        self.job_queue: queue.Queue = queue.Queue()
+        # SimpleQueue: workers only put/get, no task_done/join bookkeeping needed.
+        # A None item tells a worker to stop, see shutdown().
+        self.job_queue: queue.SimpleQueue = queue.SimpleQueue()
         self.shutdown_event = threading.Event()
         self.shutdown_folder = shutdown_folder
 
@@ -243,9 +406,91 @@ class FileMonitor:
         self.workers: List[threading.Thread] = []
         self.num_workers = num_workers
         self.shutdown_monitor = None
+        self.command_processor = None
         # manages state of filemonitor in dataframe
         self.state_tracker = FileStateTracker()
+        # Commands posted by other threads (web UI), applied by CommandProcessor,
+        # a None item tells it to stop, see shutdown()
+        self.commands: queue.Queue = queue.Queue()
+        # Workers wait on this between status checks, notify_status wakes them
+        self._status_cv = threading.Condition()
+        self._status_changed: Set[str] = set()
+        # file name -> number of workers monitoring it, notify_status ignores other names
+        self._monitoring: Dict[str, int] = {}
+        # Processes for create_manifest, started on first use. spawn, not fork:
+        # forking while the worker/web threads run can copy a held lock (e.g. stdout's)
+        # into the child, which then hangs and shutdown() waits on it forever
+        self._manifest_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                  mp_context=multiprocessing.get_context("spawn"))
+
+
+    def post(self, command: tuple) -> None:
+        """
+        Queue a command for the CommandProcessor thread and return immediately.
 
+        Args:
+            command: Command tuple, e.g. ('clear',)
+        """
+        self.commands.put(command)
+
+    def notify_status(self, file_name: str) -> None:
+        """
+        Tell the monitor the status of a file has changed.
+
+        The worker monitoring this file checks its status right away instead of
+        waiting for the rest of monitor_interval. Can be called from any thread,
+        e.g. by a webhook or a file watcher.
+
+        Args:
+            file_name: Name of the file whose status changed
+        """
+        with self._status_cv:
+            # Nobody is waiting on it, don't leave it in the set to skip a later wait
+            if file_name in self._monitoring:
+                self._status_changed.add(file_name)
+                self._status_cv.notify_all()
+
+    @contextmanager
+    def monitoring(self, file_name: str):
+        """
+        Mark file_name as being monitored while the with block runs, so
+        notify_status only records changes for files a worker is watching.
+
+        Args:
+            file_name: Name of the file being monitored
+        """
+        with self._status_cv:
+            self._monitoring[file_name] = self._monitoring.get(file_name, 0) + 1
+        try:
+            yield
+        finally:
+            with self._status_cv:
+                remaining = self._monitoring[file_name] - 1
+                if remaining:
+                    self._monitoring[file_name] = remaining
+                else:
+                    del self._monitoring[file_name]
+                    self._status_changed.discard(file_name)
+
+    def wait_for_status(self, file_name: str, timeout: float) -> None:
+        """
+        Block until notify_status is called for file_name, shutdown starts,
+        or timeout seconds pass.
+
+        Args:
+            file_name: Name of the file being monitored
+            timeout: Maximum seconds to wait
+        """
+        with self._status_cv:
+            self._status_cv.wait_for(
+                lambda: file_name in self._status_changed or self.shutdown_event.is_set(),
+                timeout=timeout
+            )
+            self._status_changed.discard(file_name)
+
+    def _do_clear(self) -> None:
+        """Clears the tracked file states, runs on the CommandProcessor thread."""
+        self.state_tracker.clear_data()
 
     def file_arrival_api(self) -> List[FileMetadata]:
         """
@@ -263,24 +508,28 @@ class FileMonitor:
         watch_dir = "/path/to/watch"
         lookback_minutes = self.gather_check_times
         cutoff_time = datetime.now() - timedelta(minutes=lookback_minutes)
+        # Compare raw float mtimes, a datetime is built only for matching files
+        cutoff_ts = cutoff_time.timestamp()
 
         arrived_files = []
 
         # In real implementation, this would be replaced with actual API call
         # This is just to demonstrate the logic
         try:
-            for filename in os.listdir(watch_dir):
-                filepath = os.path.join(watch_dir, filename)
-                if os.path.isfile(filepath):
-                    stat = os.stat(filepath)
-                    modified_time = datetime.fromtimestamp(stat.st_mtime)
+            # scandir returns the file type with each entry, and caches stat,
+            # so there is no separate isfile/stat call per file
+            with os.scandir(watch_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
 
                     # Only include files modified within the lookback window
-                    if modified_time >= cutoff_time:
+                    if stat.st_mtime >= cutoff_ts:
                         arrived_files.append(FileMetadata(
-                            name=filename,
+                            name=entry.name,
                             size=stat.st_size,
-                            modified_time=modified_time
+                            modified_time=datetime.fromtimestamp(stat.st_mtime)
                         ))
         except Exception as e:
             self.alert_api(
@@ -318,13 +567,23 @@ class FileMonitor:
         """
         Creates manifest files for all files in a gather group.
 
+        Each manifest is built by build_manifest in the manifest process pool,
+        this returns without waiting for them. Failures are sent to alert_api.
+
         Args:
             gather_object: GatherObject containing files needing manifests
         """
         for file_obj in gather_object.files:
-            manifest_name = f"{gather_object.parent_job_id}_{file_obj.file_name}.manifest"
-            # Implementation would go here
-            print(f"Created manifest: {manifest_name}")
+            future = self._manifest_pool.submit(
+                build_manifest, gather_object.parent_job_id, file_obj.file_name
+            )
+            future.add_done_callback(self._manifest_done)
+
+    def _manifest_done(self, future: Future) -> None:
+        """Raise an alert if a manifest could not be created."""
+        error = future.exception()
+        if error is not None:
+            self.alert_api(f"Error creating manifest: {str(error)}", "error")
 
     class WorkerManager(threading.Thread):
         """
@@ -347,48 +606,58 @@ class FileMonitor:
 
         def run(self) -> None:
             """Main execution loop for the WorkerManager."""
-            schedule.every(self.file_monitor.gather_interval).minutes.do(self.gather_files)
-
-            while not self.file_monitor.shutdown_event.is_set():
-                schedule.run_pending()
-                time.sleep(1)
-
-    def gather_files(self) -> None:
-        """
-        Performs a complete gathering cycle for new files, stopping when no new files
-        are detected for 5 minutes or when the gather window completes.
-        """
-        self.current_gather = GatherObject()
-        last_file_time = time.time()
-        files_seen = set()
+            interval = self.file_monitor.gather_interval * 60
+            # monotonic clock, not affected by wall clock changes
+            next_run = time.monotonic() + interval
+
+            # Sleep until the next gather, returns as soon as shutdown is signalled
+            while not self.file_monitor.shutdown_event.wait(max(0, next_run - time.monotonic())):
+                self.gather_files()
+                next_run += interval
+                # A gather that ran past the next slot doesn't cause back to back catch up runs
+                now = time.monotonic()
+                if next_run <= now:
+                    next_run = now + interval
+
+        def gather_files(self) -> None:
+            """
+            Performs a complete gathering cycle for new files, stopping when no new files
+            are detected for 5 minutes or when the gather window completes.
+            """
+            self.current_gather = GatherObject()
+            last_file_time = time.time()
+            files_seen = set()
 
-        while True:
-            if self.file_monitor.shutdown_event.is_set():
-                break
+            while True:
+                if self.file_monitor.shutdown_event.is_set():
+                    break
 
-            new_files = self.file_monitor.file_arrival_api()
-            found_new = False
+                new_files = self.file_monitor.file_arrival_api()
+                found_new = False
 
-            for file_metadata in new_files:
-                if file_metadata not in files_seen:
-                    self.current_gather.add_file(file_metadata)
-                    files_seen.add(file_metadata)
-                    last_file_time = time.time()
-                    found_new = True
+                for file_metadata in new_files:
+                    if file_metadata not in files_seen:
+                        self.current_gather.add_file(file_metadata)
+                        files_seen.add(file_metadata)
+                        last_file_time = time.time()
+                        found_new = True
 
-            # Break if no new files for 5 minutes
-            if time.time() - last_file_time > 300:  # 5 minutes in seconds
-                break
+                # Break if no new files for 5 minutes
+                if time.time() - last_file_time > 300:  # 5 minutes in seconds
+                    break
 
-            time.sleep(self.file_monitor.gather_check_interval * 60)
+                if self.file_monitor.shutdown_event.wait(self.file_monitor.gather_check_interval * 60):
+                    break
 
-        # Add gathered files to queue
-        for file_obj in self.current_gather.files:
-            self.file_monitor.job_queue.put(file_obj)
+            # Record the gathered files as PENDING, one lock per shard for the whole gather
+            self.file_monitor.state_tracker.bulk_update(self.current_gather.files)
 
-        # Create manifest
-        self.file_monitor.create_manifest(self.current_gather)
+            # Add gathered files to queue
+            for file_obj in self.current_gather.files:
+                self.file_monitor.job_queue.put(file_obj)
 
+            # Create manifest
+            self.file_monitor.create_manifest(self.current_gather)
 
     class Worker(threading.Thread):
         """
@@ -412,13 +681,12 @@ class FileMonitor:
 
         def run(self) -> None:
             """Main execution loop for the Worker."""
-            while not self.file_monitor.shutdown_event.is_set():
-                try:
-                    file_obj = self.file_monitor.job_queue.get(timeout=1)
-                    self.monitor_file(file_obj)
-                    self.file_monitor.job_queue.task_done()
-                except queue.Empty:
-                    continue
+            while True:
+                # Blocks until there is work, shutdown() puts one None per worker
+                file_obj = self.file_monitor.job_queue.get()
+                if file_obj is None or self.file_monitor.shutdown_event.is_set():
+                    break
+                self.monitor_file(file_obj)
 
         def monitor_file(self, file_obj: FileObject) -> None:
             """
@@ -427,32 +695,44 @@ class FileMonitor:
             Args:
                 file_obj: FileObject to monitor
             """
+            # Bind what the loop uses to locals, saves the self.file_monitor.X lookups each pass
+            fm = self.file_monitor
+            shutdown = fm.shutdown_event
+            status_api = fm.file_status_api
+            tracker_update = fm.state_tracker.update_file_state
+            alert = fm.alert_api
+            wait_for_status = fm.wait_for_status
+            monitor_sleep = fm.monitor_interval * 60
+            file_name = file_obj.file_name
+
             file_obj.start_time = datetime.now()
 
-            for _ in range(self.file_monitor.monitor_check_times):
-                if self.file_monitor.shutdown_event.is_set():
-                    break
+            with fm.monitoring(file_name):
+                for _ in range(fm.monitor_check_times):
+                    if shutdown.is_set():
+                        break
 
-                status = self.file_monitor.file_status_api(file_obj.file_name)
-                file_obj.status = status
+                    status = status_api(file_name)
+                    file_obj.status = status
 
-                # Update state tracker after each status change
-                self.file_monitor.state_tracker.update_file_state(file_obj)
+                    # Update state tracker after each status change
+                    tracker_update(file_obj)
 
-                if status == FileStatus.COMPLETE:
-                    break
-                elif status == FileStatus.FAIL:
-                    self.file_monitor.alert_api(
-                        f"File {file_obj.file_name} failed processing",
-                        "error"
-                    )
-                    break
+                    if status == FileStatus.COMPLETE:
+                        break
+                    elif status == FileStatus.FAIL:
+                        alert(
+                            f"File {file_name} failed processing",
+                            "error"
+                        )
+                        break
 
-                time.sleep(self.file_monitor.monitor_interval * 60)
+                    # Woken early by notify_status, monitor_interval is the upper bound
+                    wait_for_status(file_name, monitor_sleep)
 
-            if file_obj.status not in [FileStatus.COMPLETE, FileStatus.FAIL]:
-                self.file_monitor.alert_api(
-                    f"Monitoring timeout for file {file_obj.file_name}",
+            if file_obj.status not in FileStateTracker.TERMINAL_STATUSES:
+                alert(
+                    f"Monitoring timeout for file {file_name}",
                     "warning"
                 )
 
@@ -464,6 +744,9 @@ class FileMonitor:
 
         Watches a specified folder for a 'shutdown.now' file. When found,
         renames it and triggers system shutdown.
+
+        On Linux with inotify_simple installed the kernel wakes this thread
+        when the file is created, otherwise the folder is checked every 5 seconds.
         """
 
         def __init__(self, file_monitor):
@@ -478,19 +761,100 @@ class FileMonitor:
 
         def run(self) -> None:
             """Main execution loop for the ShutdownMonitor."""
+            if INotify is not None:
+                self._run_inotify()
+            else:
+                self._run_polling()
+
+        def _check_shutdown_file(self) -> bool:
+            """
+            Start the shutdown if the shutdown file exists.
+
+            Returns:
+                True if shutdown was started
+            """
+            shutdown_file = Path(self.file_monitor.shutdown_folder) / "shutdown.now"
+            if shutdown_file.exists():
+                # Rename the file to indicate shutdown has begun
+                shutdown_file.rename(shutdown_file.parent / "shutdown.now.started")
+                self.file_monitor.shutdown()
+                return True
+            return False
+
+        def _run_polling(self) -> None:
+            """Check for the shutdown file every 5 seconds."""
             while not self.file_monitor.shutdown_event.is_set():
-                shutdown_file = Path(self.file_monitor.shutdown_folder) / "shutdown.now"
-                if shutdown_file.exists():
-                    # Rename the file to indicate shutdown has begun
-                    shutdown_file.rename(shutdown_file.parent / "shutdown.now.started")
-                    self.file_monitor.shutdown()
-                time.sleep(5)
+                if self._check_shutdown_file():
+                    break
+                if self.file_monitor.shutdown_event.wait(5):
+                    break
+
+        def _run_inotify(self) -> None:
+            """Block in the kernel until a file is created or moved into the folder."""
+            inotify = None
+            try:
+                inotify = INotify()
+                inotify.add_watch(self.file_monitor.shutdown_folder,
+                                  inotify_flags.CREATE | inotify_flags.MOVED_TO)
+            except OSError as e:
+                # e.g. the folder doesn't exist yet, polling keeps checking for it
+                print(f"inotify watch failed ({e}), polling for the shutdown file")
+                if inotify is not None:
+                    inotify.close()
+                self._run_polling()
+                return
+
+            with inotify:
+                # The file may have been there before the watch was added
+                if self._check_shutdown_file():
+                    return
+                while not self.file_monitor.shutdown_event.is_set():
+                    # The timeout lets the loop see a shutdown started elsewhere
+                    events = inotify.read(timeout=5000)
+                    if any(event.name == "shutdown.now" for event in events):
+                        if self._check_shutdown_file():
+                            return
+
+    class CommandProcessor(threading.Thread):
+        """
+        Applies commands posted through FileMonitor.post.
+
+        Keeps slow state changes, like clearing the tracker, off the web
+        request threads.
+        """
+
+        def __init__(self, file_monitor):
+            """
+            Initialize the CommandProcessor.
+
+            Args:
+                file_monitor: Parent FileMonitor instance
+            """
+            super().__init__()
+            self.file_monitor = file_monitor
+
+        def run(self) -> None:
+            """Main execution loop for the CommandProcessor."""
+            while True:
+                # Blocks until a command arrives, shutdown() puts a None to stop it
+                command = self.file_monitor.commands.get()
+                if command is None or self.file_monitor.shutdown_event.is_set():
+                    break
+
+                try:
+                    if command[0] == 'clear':
+                        self.file_monitor._do_clear()
+                    else:
+                        self.file_monitor.alert_api(f"Unknown command {command}", "warning")
+                except Exception as e:
+                    self.file_monitor.alert_api(f"Error running command {command}: {str(e)}", "error")
 
     def start(self) -> None:
         """
         Start all system components.
 
-        Launches the WorkerManager, Worker pool, and ShutdownMonitor threads.
+        Launches the WorkerManager, Worker pool, ShutdownMonitor and
+        CommandProcessor threads.
         """
         # Start WorkerManager
         self.worker_manager = self.WorkerManager(self)
@@ -506,6 +870,10 @@ class FileMonitor:
         self.shutdown_monitor = self.ShutdownMonitor(self)
         self.shutdown_monitor.start()
 
+        # Start Command Processor
+        self.command_processor = self.CommandProcessor(self)
+        self.command_processor.start()
+
     def shutdown(self) -> None:
         """
         Perform graceful system shutdown.
@@ -515,6 +883,14 @@ class FileMonitor:
         print("Initiating graceful shutdown...")
         self.shutdown_event.set()
 
+        # Wake up the workers blocked on the job queue or waiting for a status
+        for _ in self.workers:
+            self.job_queue.put(None)
+        with self._status_cv:
+            self._status_cv.notify_all()
+        # and the command processor blocked on its queue
+        self.commands.put(None)
+
         # Wait for WorkerManager to complete
         if self.worker_manager:
             self.worker_manager.join()
@@ -523,10 +899,17 @@ class FileMonitor:
         for worker in self.workers:
             worker.join()
 
-        # Wait for shutdown monitor
-        if self.shutdown_monitor:
+        # Wait for shutdown monitor, unless it is the thread running this shutdown
+        if self.shutdown_monitor and self.shutdown_monitor is not threading.current_thread():
             self.shutdown_monitor.join()
 
+        # Wait for command processor
+        if self.command_processor:
+            self.command_processor.join()
+
+        # Wait for manifests still being created
+        self._manifest_pool.shutdown(wait=True)
+
         print("Shutdown complete")
 
 
@@ -549,9 +932,9 @@ def main():
 
     try:
         monitor.start()
-        # Keep main thread alive until shutdown
-        while not monitor.shutdown_event.is_set():
-            time.sleep(1)
+        # Keep main thread alive until shutdown, the timeout keeps Ctrl+C working
+        while not monitor.shutdown_event.wait(1):
+            pass
     except KeyboardInterrupt:
         monitor.shutdown()
 
@@ -1,12 +1,28 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, render_template, request, jsonify, Response
+import numpy as np
 import pandas as pd
-import io
 import os
 
+# pyarrow is optional, its CSV reader/writer is multi-threaded C++ and releases
+# the GIL, pandas' own CSV code is the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# orjson is optional, it writes numpy arrays directly without a python list per row
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 
-# Global variable to store the DataFrame
-global_df = None
+# Loaded DataFrame with its column names and row count, cached so /get_data doesn't
+# rebuild them on every request. Kept in one tuple and only ever replaced whole, so a
+# request running during an /upload or /clear never mixes old and new values.
+global_state = (None, [], 0)
 
 
 @app.route('/')
@@ -14,9 +30,25 @@ def index():
     return render_template('index.html')
 
 
+def read_csv_upload(file):
+    """Read the uploaded csv, with pyarrow when it's installed, typed the way pd.read_csv would."""
+    if pa is None:
+        return pd.read_csv(file)
+    # empty fields become NaN like pandas, not ''
+    table = pa_csv.read_csv(file.stream, convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+    # pyarrow parses date/time looking columns, pandas keeps them as text. Read those
+    # columns again as strings so the viewer shows what was uploaded.
+    temporal = {f.name: pa.string() for f in table.schema if pa.types.is_temporal(f.type)}
+    if temporal:
+        file.stream.seek(0)
+        table = pa_csv.read_csv(file.stream, convert_options=pa_csv.ConvertOptions(
+            column_types=temporal, strings_can_be_null=True))
+    return table.to_pandas()
+
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
-    global global_df
+    global global_state
     if 'file' not in request.files:
         return jsonify({'error': 'No file uploaded'}), 400
 
@@ -29,11 +61,13 @@ def upload_file():
 
     try:
         # Read CSV file into DataFrame
-        global_df = pd.read_csv(file)
-        # Convert DataFrame to dict for JSON response
+        df = read_csv_upload(file)
+        columns, total_rows = df.columns.tolist(), len(df)
+        global_state = (df, columns, total_rows)
+        # The page loads rows through /get_data, so don't send the whole table back
         data = {
-            'columns': global_df.columns.tolist(),
-            'data': global_df.values.tolist()
+            'columns': columns,
+            'total_rows': total_rows
         }
         return jsonify(data)
     except Exception as e:
@@ -42,8 +76,8 @@ def upload_file():
 
 @app.route('/get_data')
 def get_data():
-    global global_df
-    if global_df is None:
+    df, columns, total_rows = global_state
+    if df is None:
         return jsonify({'error': 'No data loaded'}), 400
 
     # Get pagination parameters
@@ -55,42 +89,90 @@ def get_data():
     end_idx = start_idx + page_size
 
     # Slice the DataFrame
-    page_df = global_df.iloc[start_idx:end_idx]
+    page_df = df.iloc[start_idx:end_idx]
+
+    arr = page_df.to_numpy()
+    if orjson is not None and arr.dtype.kind in 'iufb':
+        # orjson writes a C-contiguous int/uint/float/bool array as rows straight from
+        # numpy. Mixed columns (e.g. bool + int) come back as an object array, which
+        # orjson would hand to default=str and 'data' would become a string.
+        # to_numpy() of a multi-column frame is Fortran-ordered, so copy it to C order.
+        rows = np.ascontiguousarray(arr)
+    else:
+        rows = arr.tolist()
 
     data = {
-        'columns': global_df.columns.tolist(),
-        'data': page_df.values.tolist(),
-        'total_rows': len(global_df),
-        'total_pages': -(-len(global_df) // page_size)  # Ceiling division
+        'columns': columns,
+        'data': rows,
+        'total_rows': total_rows,
+        'total_pages': (total_rows + page_size - 1) // page_size  # Ceiling division
     }
+    if orjson is not None:
+        # NaN is written as null, other unknown types (e.g. Timestamp) as str
+        return Response(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY, default=str),
+                        mimetype='application/json')
     return jsonify(data)
 
 
+# Rows per chunk when streaming a download
+CSV_CHUNK_ROWS = 10000
+
+
+def iter_csv(df):
+    """
+    Yield df as CSV bytes, CSV_CHUNK_ROWS rows at a time, header first.
+    Only one chunk is held in memory instead of the whole CSV text.
+    Always pandas' to_csv, so the file looks the same with or without pyarrow.
+    """
+    yield df.head(0).to_csv(index=False).encode()  # header only
+    for start in range(0, len(df), CSV_CHUNK_ROWS):
+        yield df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(header=False, index=False).encode()
+
+
 @app.route('/download')
 def download():
-    global global_df
-    if global_df is None:
+    df = global_state[0]
+    if df is None:
         return jsonify({'error': 'No data to download'}), 400
 
-    # Create a buffer
-    buffer = io.StringIO()
-    global_df.to_csv(buffer, index=False)
-    buffer.seek(0)
-
-    return send_file(
-        io.BytesIO(buffer.getvalue().encode()),
+    # iter_csv holds its own reference, so a /clear during the download is fine
+    return Response(
+        iter_csv(df),
         mimetype='text/csv',
-        as_attachment=True,
-        download_name='exported_data.csv'
+        headers={'Content-Disposition': 'attachment; filename=exported_data.csv'}
     )
 
 
 @app.route('/clear')
 def clear():
-    global global_df
-    global_df = None
+    global global_state
+    global_state = (None, [], 0)
     return jsonify({'message': 'Data cleared successfully'})
 
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    import argparse
+
+    parser = argparse.ArgumentParser(description='CSV viewer')
+    parser.add_argument('--dev', action='store_true',
+                        help='run the Flask dev server with debug and the reloader')
+    # localhost only by default, pass --host 0.0.0.0 to open it to the network
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    if args.dev:
+        # the interactive debugger runs code from the browser, never expose it beyond localhost
+        app.run(host='127.0.0.1', port=args.port, debug=True)
+    else:
+        # waitress serves requests on a pool of threads, pandas/pyarrow release the
+        # GIL in their C code so pages and downloads overlap. Stay on one process,
+        # global_state lives in this process' memory only.
+        # With gunicorn: gunicorn -w 1 --worker-class gthread --threads 8 app:app
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host=args.host, port=args.port, threaded=True)
+        else:
+            serve(app, host=args.host, port=args.port, threads=args.threads)
@@ -5,15 +5,19 @@ app = Flask(__name__) # Flask constructor
 
 # A decorator used to tell the application
 # which URL is associated function
+# the body never changes, so encode it once here instead of on every request
+HELLO_BODY = b"HELLO WORLD!"
+
 @app.route('/')	
 def hello():
-	return "HELLO WORLD!"
+	return HELLO_BODY
 
 # routing the decorator function hello_name
 # localhost:5000/hello/flask
 @app.route('/hello/<name>')  
 def hello_name(name):
-   return f'Hello {name}!'
+   # returning bytes skips Flask's str -> bytes encoding step
+   return b'Hello %s!' % name.encode()
 
 if __name__=='__main__':
     # default points to localhost:5000
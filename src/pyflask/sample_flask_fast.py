@@ -0,0 +1,57 @@
+# sample_flask_fast.py
+# the same two routes as sample_flask.py, served without Flask.
+# sample_flask.py stays the reference, this one uses only the standard library:
+# a precompiled regex table instead of Flask/Werkzeug routing, so each request
+# goes through far fewer python frames.
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+
+# the body never changes, so it's encoded once here
+HELLO_BODY = b"HELLO WORLD!"
+
+
+# localhost:5000
+def hello():
+    return HELLO_BODY
+
+
+# localhost:5000/hello/flask
+def hello_name(name):
+    return b'Hello %s!' % name.encode()
+
+
+# (compiled pattern, handler), the named groups become the handler's arguments
+ROUTES = (
+    (re.compile(r'^/$'), hello),
+    (re.compile(r'^/hello/(?P<name>[^/]+)$'), hello_name),
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        for pattern, view in ROUTES:
+            match = pattern.match(path)
+            if match:
+                kwargs = {k: unquote(v) for k, v in match.groupdict().items()}
+                self.send_body(200, view(**kwargs))
+                return
+        self.send_body(404, b'Not Found')
+
+    def send_body(self, code, body):
+        self.send_response(code)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == '__main__':
+    # default points to localhost:5000, one thread per request like app.run()
+    server = ThreadingHTTPServer(('127.0.0.1', 5000), Handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()